@@ -0,0 +1,279 @@
+"""
+Batch API summarization for newsroom.
+
+This module sends article and daily overview requests through OpenAI's Batch
+API, which is cheaper than synchronous calls but may take hours to complete.
+Progress is saved to a state file after every step so that a restarted run
+resumes polling its submitted batches instead of resubmitting them.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import time
+
+from . import batch_plan
+from .batch_state import BatchStateStore
+from .summarizer import LLMSummarizer
+
+logger = logging.getLogger(__name__)
+
+class BatchError(Exception):
+    """Raised when a submitted batch fails, expires or is cancelled."""
+
+class BatchSummarizer:
+    """Summarizes the stories of one or more digests through the OpenAI Batch API.
+
+    Every article of every digest in a run goes into one batch. The daily
+    overviews are built from those summaries, so they go into a second batch,
+    with one request per digest, once the first completes. Articles already in
+    the summarizer's cache, or repeated across digests, are requested only once.
+    """
+
+    COMPLETION_WINDOW = "24h"
+    FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+    def __init__(
+        self,
+        summarizer: LLMSummarizer,
+        state_dir: str = ".batch",
+        poll_interval: float = 60.0
+    ):
+        """Initialize the batch summarizer.
+
+        Args:
+            summarizer: Summarizer providing the client, models, prompts and cache
+            state_dir: Directory for batch input files and resume state (default: ".batch")
+            poll_interval: Seconds between batch status checks (default: 60)
+        """
+        self.summarizer = summarizer
+        self.client = summarizer.client
+        self.store = BatchStateStore(state_dir)
+        self.poll_interval = poll_interval
+
+    def load_stories(self, run_key: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        """Get the stories of an in-progress run.
+
+        Args:
+            run_key: Run identifier, such as a digest's output file path
+
+        Returns:
+            Stories by digest key that the pending batches were built from,
+            or None if there is no run to resume
+        """
+        return self.store.load_stories(run_key)
+
+    def clear(self, run_key: str) -> None:
+        """Remove the saved state and batch input files once a run's digests are written.
+
+        Args:
+            run_key: Run identifier
+        """
+        self.store.clear(run_key)
+
+    def _find_batch(self, phase_state: Dict[str, Any]) -> Optional[str]:
+        """Find the batch created from a phase's uploaded input file.
+
+        Batches are listed newest first, page by page, and the search stops at
+        the first batch created before the input file was uploaded.
+
+        Args:
+            phase_state: Phase state with "input_file_id" and "uploaded_at"
+
+        Returns:
+            ID of the matching batch, or None if there is none
+        """
+        for batch in self.client.batches.list(limit=100):
+            if batch.created_at < phase_state.get("uploaded_at", 0):
+                break
+            if batch.input_file_id == phase_state["input_file_id"]:
+                return batch.id
+        return None
+
+    def _submit(
+        self,
+        run_key: str,
+        state: Dict[str, Any],
+        phase: str,
+        batch_requests: List[Dict[str, Any]]
+    ) -> str:
+        """Upload a phase's JSONL batch input file and create its batch.
+
+        The uploaded file's ID is saved before the batch is created. If the
+        process dies in between, the next run finds the batch that was created
+        from that file instead of creating and paying for a second one.
+
+        Args:
+            run_key: Run identifier
+            state: State dictionary, updated and saved in place
+            phase: STAGE_ARTICLE or STAGE_DAILY
+            batch_requests: Requests built by batch_plan.build_request
+
+        Returns:
+            ID of the created batch
+        """
+        phase_state = state.setdefault(phase, {})
+        input_file_id = phase_state.get("input_file_id")
+        if input_file_id:
+            batch_id = self._find_batch(phase_state)
+            if batch_id:
+                logger.info(f"Found {phase} batch {batch_id} created before the last run stopped")
+                return batch_id
+        else:
+            input_path = self.store.write_input(run_key, phase, batch_requests)
+            with open(input_path, 'rb') as f:
+                uploaded = self.client.files.create(file=f, purpose="batch")
+            input_file_id = uploaded.id
+            phase_state["input_file_id"] = input_file_id
+            phase_state["uploaded_at"] = uploaded.created_at
+            self.store.save(run_key, state)
+
+        batch = self.client.batches.create(
+            input_file_id=input_file_id,
+            endpoint=batch_plan.ENDPOINT,
+            completion_window=self.COMPLETION_WINDOW
+        )
+        logger.info(f"Submitted {phase} batch {batch.id} with {len(batch_requests)} requests")
+        return batch.id
+
+    def _wait(self, batch_id: str) -> Any:
+        """Poll a batch until it reaches a terminal status.
+
+        Args:
+            batch_id: ID of the batch
+
+        Returns:
+            The completed batch object
+
+        Raises:
+            BatchError: If the batch failed, expired or was cancelled
+        """
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                return batch
+            if batch.status in self.FAILED_STATUSES:
+                raise BatchError(f"Batch {batch_id} ended with status {batch.status}")
+
+            logger.info(
+                f"Batch {batch_id} is {batch.status}, checking again in {self.poll_interval}s"
+            )
+            time.sleep(self.poll_interval)
+
+    def _read_results(self, batch: Any) -> Dict[str, str]:
+        """Download a completed batch's output and error files and map them by custom ID.
+
+        Args:
+            batch: Completed batch object
+
+        Returns:
+            Generated text by custom ID; failed or unreadable records are omitted
+        """
+        output, errors = (
+            self.client.files.content(file_id).text if file_id else ""
+            for file_id in (batch.output_file_id, batch.error_file_id)
+        )
+        return batch_plan.parse_results(output, errors)
+
+    def _run_phase(
+        self,
+        run_key: str,
+        state: Dict[str, Any],
+        phase: str,
+        batch_requests: List[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        """Submit a phase's batch, or resume the one already submitted, and wait for it.
+
+        Args:
+            run_key: Run identifier
+            state: State dictionary, updated and saved in place
+            phase: STAGE_ARTICLE or STAGE_DAILY
+            batch_requests: Requests to submit if no batch is pending
+
+        Returns:
+            Generated text by custom ID; each request is also added to the state's
+            call report
+
+        Raises:
+            BatchError: If the batch failed, expired or was cancelled
+        """
+        phase_state = state.setdefault(phase, {})
+        if "batch_id" in phase_state:
+            logger.info(f"Resuming {phase} batch {phase_state['batch_id']}")
+        else:
+            phase_state["batch_id"] = self._submit(run_key, state, phase, batch_requests)
+            phase_state["submitted_at"] = time.time()
+            self.store.save(run_key, state)
+
+        try:
+            batch = self._wait(phase_state["batch_id"])
+        except BatchError:
+            # Forget the dead batch so the next run resubmits this phase
+            del state[phase]
+            self.store.save(run_key, state)
+            raise
+
+        results = self._read_results(batch)
+        # Batch latency is measured from submission, including any time spent stopped
+        latency = time.time() - phase_state["submitted_at"]
+        for request in batch_requests:
+            state["calls"].append({
+                "stage": phase,
+                "tier": "batch",
+                "model": request["body"]["model"],
+                "latency": latency,
+                "status": "ok" if request["custom_id"] in results else "error"
+            })
+        return results
+
+    def summarize(
+        self,
+        run_key: str,
+        stories: Dict[str, List[Dict[str, str]]]
+    ) -> Dict[str, Tuple[List[str], Optional[str]]]:
+        """Summarize every digest of a run, resuming the run if it is in progress.
+
+        Args:
+            run_key: Run identifier
+            stories: Story dictionaries by digest key; ignored when resuming a saved run
+
+        Returns:
+            Article summaries (one per story) and daily overview by digest key
+
+        Raises:
+            BatchError: If a batch failed, expired or was cancelled
+        """
+        summarizer = self.summarizer
+        state = self.store.load(run_key)
+        if not state:
+            state = {"stories": stories, "calls": []}
+            batch_plan.plan_articles(summarizer, state)
+            self.store.save(run_key, state)
+
+        if "article_summaries" not in state:
+            batch_requests = batch_plan.article_requests(summarizer, state)
+            results = {}
+            if batch_requests:
+                results = self._run_phase(
+                    run_key, state, summarizer.STAGE_ARTICLE, batch_requests
+                )
+            state["article_summaries"] = batch_plan.collect_articles(summarizer, state, results)
+            self.store.save(run_key, state)
+
+        if "daily_overviews" not in state:
+            batch_requests = batch_plan.daily_requests(summarizer, state["article_summaries"])
+            results = {}
+            if batch_requests:
+                results = self._run_phase(run_key, state, summarizer.STAGE_DAILY, batch_requests)
+            state["daily_overviews"] = {
+                key: results.get(f"{key}/daily") for key in state["article_summaries"]
+            }
+            self.store.save(run_key, state)
+
+        # Rebuild the report from the state so phases finished before a restart are included
+        for call in state["calls"]:
+            summarizer.report.record(**call)
+
+        return {
+            key: (state["article_summaries"][key], state["daily_overviews"][key])
+            for key in state["stories"]
+        }
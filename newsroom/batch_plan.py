@@ -0,0 +1,219 @@
+"""
+Batch request planning for BatchSummarizer.
+
+Builds the JSONL request lines of a run's article and daily overview batches
+and maps their results back to the stories they were built from.
+"""
+
+from typing import Any, Dict, List
+import json
+import logging
+
+from .summarizer import LLMSummarizer
+
+logger = logging.getLogger(__name__)
+
+ENDPOINT = "/v1/chat/completions"
+
+def build_request(
+    custom_id: str,
+    model: str,
+    prompt: str,
+    content: str,
+    max_tokens: int,
+    temperature: float
+) -> Dict[str, Any]:
+    """Build one line of a batch input file.
+
+    Args:
+        custom_id: Identifier used to match the result to the request
+        model: OpenAI model to use
+        prompt: System prompt for the model
+        content: User content to process
+        max_tokens: Maximum tokens in response
+        temperature: Model temperature
+
+    Returns:
+        Batch request dictionary
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": ENDPOINT,
+        "body": {
+            "model": model,
+            "messages": [
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": content}
+            ],
+            "max_tokens": max_tokens,
+            "temperature": temperature
+        }
+    }
+
+def plan_articles(summarizer: LLMSummarizer, state: Dict[str, Any]) -> None:
+    """Decide how each story's summary is obtained and save the plan in the state.
+
+    Each story maps to None (nothing to summarize), a cached summary, or the
+    custom ID of the batch request that summarizes its text. Articles repeated
+    across digests share one request.
+
+    Args:
+        summarizer: Summarizer whose article cache is checked
+        state: State dictionary with "stories" and "calls", updated in place
+    """
+    requested: Dict[str, str] = {}
+    state["article_plan"] = {}
+    for key, stories in state["stories"].items():
+        entries = []
+        for i, story in enumerate(stories):
+            content = story.get('summary')
+            cached = summarizer.article_cache.get(content) if content else None
+            if not content:
+                entries.append(None)
+            elif cached:
+                summary, model = cached
+                entries.append({"summary": summary})
+                state["calls"].append({
+                    "stage": summarizer.STAGE_ARTICLE,
+                    "tier": "cache",
+                    "model": model,
+                    "latency": 0.0,
+                    "status": "ok"
+                })
+            else:
+                custom_id = requested.setdefault(content, f"{key}/article-{i}")
+                entries.append({"custom_id": custom_id})
+        state["article_plan"][key] = entries
+
+def article_requests(summarizer: LLMSummarizer, state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Build the article batch requests from the saved plan.
+
+    Args:
+        summarizer: Summarizer providing the model, prompt and limits
+        state: State dictionary with "stories" and "article_plan"
+
+    Returns:
+        One request per distinct article text
+    """
+    batch_requests: Dict[str, Dict[str, Any]] = {}
+    for key, entries in state["article_plan"].items():
+        for story, entry in zip(state["stories"][key], entries):
+            custom_id = entry.get("custom_id") if entry else None
+            if custom_id and custom_id not in batch_requests:
+                batch_requests[custom_id] = build_request(
+                    custom_id,
+                    summarizer.article_model,
+                    summarizer.ARTICLE_PROMPT,
+                    summarizer.format_article_content(story['summary']),
+                    summarizer.article_max_tokens,
+                    summarizer.temperature
+                )
+    return list(batch_requests.values())
+
+def collect_articles(
+    summarizer: LLMSummarizer,
+    state: Dict[str, Any],
+    results: Dict[str, str]
+) -> Dict[str, List[str]]:
+    """Map article batch results back to each digest and fill the summary cache.
+
+    Args:
+        summarizer: Summarizer whose article cache is filled
+        state: State dictionary with "stories" and "article_plan"
+        results: Generated text by custom ID
+
+    Returns:
+        Article summaries by digest key, one per story
+    """
+    summaries: Dict[str, List[str]] = {}
+    for key, entries in state["article_plan"].items():
+        summaries[key] = []
+        for story, entry in zip(state["stories"][key], entries):
+            entry = entry or {}
+            summary = entry.get("summary") or results.get(entry.get("custom_id"))
+            if summary and "custom_id" in entry:
+                summarizer.article_cache[story['summary']] = (summary, summarizer.article_model)
+            summaries[key].append(summary or "No summary available.")
+    return summaries
+
+def daily_requests(
+    summarizer: LLMSummarizer,
+    article_summaries: Dict[str, List[str]]
+) -> List[Dict[str, Any]]:
+    """Build the daily overview batch requests, one per digest with summaries.
+
+    Args:
+        summarizer: Summarizer providing the model, prompt and limits
+        article_summaries: Article summaries by digest key
+
+    Returns:
+        Requests with custom IDs like "us/daily"
+    """
+    return [
+        build_request(
+            f"{key}/daily",
+            summarizer.daily_model,
+            summarizer.DAILY_PROMPT,
+            summarizer.format_daily_content(summaries),
+            summarizer.daily_max_tokens,
+            summarizer.temperature
+        )
+        for key, summaries in article_summaries.items()
+        if summaries
+    ]
+
+def _parse_records(text: str) -> List[Any]:
+    """Parse the JSONL records of a batch output or error file.
+
+    Args:
+        text: File content
+
+    Returns:
+        Parsed records; unreadable lines are logged and skipped
+    """
+    records = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError as e:
+            logger.warning(f"Skipping unreadable batch record: {str(e)}")
+    return records
+
+def parse_results(output: str, errors: str) -> Dict[str, str]:
+    """Map a completed batch's results by custom ID.
+
+    Requests that failed are logged with their error, whether they are reported
+    in the output file or in the batch's separate error file.
+
+    Args:
+        output: Content of the batch's output file
+        errors: Content of the batch's error file
+
+    Returns:
+        Generated text by custom ID; failed or unreadable records are omitted
+    """
+    results = {}
+    for record in _parse_records(output):
+        try:
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                logger.warning(
+                    f"Batch request {record.get('custom_id')} failed: {record.get('error')}"
+                )
+                continue
+            message = response["body"]["choices"][0]["message"]
+            results[record["custom_id"]] = message["content"].strip()
+        except (KeyError, IndexError, TypeError, AttributeError) as e:
+            logger.warning(f"Skipping unreadable batch output record: {str(e)}")
+
+    for record in _parse_records(errors):
+        try:
+            error = record.get("error") or record["response"]["body"]["error"]
+            custom_id = record.get("custom_id")
+        except (KeyError, TypeError, AttributeError):
+            error, custom_id = record, None
+        logger.warning(f"Batch request {custom_id} failed: {error}")
+    return results
@@ -0,0 +1,121 @@
+"""
+Resume state for Batch API runs.
+
+Each run keeps one JSON state file, plus the JSONL input file of each phase,
+in a state directory so that a restarted process can pick up where it stopped.
+"""
+
+from typing import Any, Dict, List, Optional
+import json
+import os
+
+from . import utils
+
+class BatchStateStore:
+    """Reads and writes the state files of Batch API runs."""
+
+    PHASES = ("article", "daily")
+
+    def __init__(self, state_dir: str = ".batch"):
+        """Initialize the store.
+
+        Args:
+            state_dir: Directory for batch input files and resume state (default: ".batch")
+        """
+        self.state_dir = state_dir
+
+    def get_state_path(self, run_key: str) -> str:
+        """Get the state file path for a run.
+
+        Args:
+            run_key: Run identifier, such as a digest's output file path
+
+        Returns:
+            Path to the JSON state file
+        """
+        name = utils.slugify(run_key.replace(os.sep, '-'))
+        return os.path.join(self.state_dir, f"{name}.json")
+
+    def get_input_path(self, run_key: str, phase: str) -> str:
+        """Get the JSONL batch input file path for a run's phase.
+
+        Args:
+            run_key: Run identifier
+            phase: "article" or "daily"
+
+        Returns:
+            Path to the JSONL file
+        """
+        return f"{self.get_state_path(run_key)[:-len('.json')]}-{phase}.jsonl"
+
+    def load(self, run_key: str) -> Optional[Dict[str, Any]]:
+        """Load the saved state for a run.
+
+        Args:
+            run_key: Run identifier
+
+        Returns:
+            State dictionary, or None if no run is in progress
+        """
+        path = self.get_state_path(run_key)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def save(self, run_key: str, state: Dict[str, Any]) -> None:
+        """Atomically save the state for a run.
+
+        Args:
+            run_key: Run identifier
+            state: State dictionary
+        """
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self.get_state_path(run_key)
+        # Write then rename so a crash never leaves a truncated state file
+        with open(f"{path}.tmp", 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(f"{path}.tmp", path)
+
+    def write_input(self, run_key: str, phase: str, batch_requests: List[Dict[str, Any]]) -> str:
+        """Write a phase's requests to its JSONL batch input file.
+
+        Args:
+            run_key: Run identifier
+            phase: "article" or "daily"
+            batch_requests: One request dictionary per line
+
+        Returns:
+            Path to the JSONL file
+        """
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self.get_input_path(run_key, phase)
+        with open(path, 'w') as f:
+            for request in batch_requests:
+                f.write(json.dumps(request) + "\n")
+        return path
+
+    def load_stories(self, run_key: str) -> Optional[Dict[str, List[Dict[str, str]]]]:
+        """Get the stories of an in-progress run.
+
+        Args:
+            run_key: Run identifier
+
+        Returns:
+            Stories by digest key that the pending batches were built from,
+            or None if there is no run to resume
+        """
+        state = self.load(run_key)
+        return state["stories"] if state else None
+
+    def clear(self, run_key: str) -> None:
+        """Remove a run's state and batch input files.
+
+        Args:
+            run_key: Run identifier
+        """
+        paths = [self.get_state_path(run_key)]
+        paths += [self.get_input_path(run_key, phase) for phase in self.PHASES]
+        for path in paths:
+            if os.path.exists(path):
+                os.remove(path)
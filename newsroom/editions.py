@@ -0,0 +1,296 @@
+"""
+Multi-edition digest generation for newsroom.
+
+This module generates digests for several Google News regions and topic
+sections in one run. Work is done in phases across all editions (fetch every
+feed, summarize every article, write the overviews) on one shared worker pool,
+with one HTTP session and one summary cache.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import os
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .batch import BatchSummarizer
+from .generator import NewsDigestGenerator
+from .sources.google_news import GoogleNewsScraper
+from .summarizer import LLMSummarizer
+from . import utils
+
+logger = logging.getLogger(__name__)
+
+EDITION_KEYS = {"name", "hl", "gl", "ceid", "topic"}
+
+# Collections that src/content/config.ts already defines for non-edition content
+RESERVED_NAMES = {"digests"}
+
+STATUS_GENERATED = "generated"
+STATUS_SKIPPED = "skipped"
+STATUS_FAILED = "failed"
+
+def load_editions(path: str) -> List[Dict[str, str]]:
+    """Load and validate an editions config file.
+
+    The file is JSON with an "editions" list, for example:
+    {"editions": [{"name": "uk-business", "hl": "en-GB", "gl": "GB",
+                   "ceid": "GB:en", "topic": "BUSINESS"}]}
+
+    Args:
+        path: Path to the editions JSON file
+
+    Returns:
+        List of edition dictionaries
+
+    Raises:
+        ValueError: If the file is missing, malformed or an edition is invalid
+    """
+    try:
+        with open(path) as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Failed to read editions config {path}: {str(e)}")
+
+    editions = config.get("editions") if isinstance(config, dict) else None
+    if not editions:
+        raise ValueError(f"No editions defined in {path}")
+
+    if not isinstance(editions, list):
+        raise ValueError(f"Editions in {path} must be a list")
+
+    names = set()
+    for edition in editions:
+        if not isinstance(edition, dict):
+            raise ValueError(f"Each edition must be an object, got {edition!r}")
+        name = edition.get("name", "")
+        # The name doubles as the output subdirectory and Astro collection name
+        if not isinstance(name, str) or not name or utils.slugify(name) != name:
+            raise ValueError(f"Edition name must be a non-empty slug, got {name!r}")
+        if name in RESERVED_NAMES:
+            raise ValueError(f"Edition name {name!r} is reserved for an existing collection")
+        if name in names:
+            raise ValueError(f"Duplicate edition name {name!r}")
+        unknown = set(edition) - EDITION_KEYS
+        if unknown:
+            raise ValueError(f"Unknown keys for edition {name!r}: {', '.join(sorted(unknown))}")
+        for key, value in edition.items():
+            if not isinstance(value, str):
+                raise ValueError(f"Edition {name!r} field {key!r} must be a string, got {value!r}")
+        names.add(name)
+
+    return editions
+
+class EditionRunner:
+    """Generates digests for many editions with shared resources."""
+
+    def __init__(
+        self,
+        editions: List[Dict[str, str]],
+        output_root: str = "src/content",
+        max_stories: int = 10,
+        use_llm: bool = True,
+        workers: int = 4,
+        batch_dir: Optional[str] = None,
+        batch_poll_interval: float = 60.0,
+        **llm_options: Any
+    ):
+        """Initialize the runner.
+
+        Args:
+            editions: Edition dictionaries as returned by load_editions
+            output_root: Directory holding one subdirectory per edition (default: "src/content")
+            max_stories: Maximum number of stories per edition (default: 10)
+            use_llm: Whether to use LLM summarization (default: True)
+            workers: Number of feeds and LLM calls handled concurrently (default: 4)
+            batch_dir: Summarize through the OpenAI Batch API, keeping resume state
+                in this directory (default: None, synchronous calls)
+            batch_poll_interval: Seconds between batch status checks (default: 60)
+            **llm_options: Keyword arguments for LLMSummarizer (model, temperature, ...)
+        """
+        self.editions = editions
+        self.output_root = output_root
+        self.max_stories = max_stories
+        self.workers = workers
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=workers)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.summarizer: Optional[LLMSummarizer] = None
+        self.use_llm = use_llm
+        if use_llm:
+            try:
+                self.summarizer = LLMSummarizer(**llm_options)
+            except ValueError as e:
+                logger.warning(f"Failed to initialize LLM summarizer: {str(e)}")
+                self.use_llm = False
+
+        self.batch: Optional[BatchSummarizer] = None
+        if self.use_llm and batch_dir:
+            self.batch = BatchSummarizer(
+                self.summarizer,
+                state_dir=batch_dir,
+                poll_interval=batch_poll_interval
+            )
+
+    def _create_generator(self, edition: Dict[str, str]) -> NewsDigestGenerator:
+        """Create a digest generator for one edition using the shared resources.
+
+        Args:
+            edition: Edition dictionary
+
+        Returns:
+            Generator writing into the edition's own subdirectory
+        """
+        source_kwargs = {key: value for key, value in edition.items() if key != "name"}
+        return NewsDigestGenerator(
+            source_class=GoogleNewsScraper,
+            max_stories=self.max_stories,
+            use_llm=self.use_llm,
+            output_dir=os.path.join(self.output_root, edition["name"]),
+            source_kwargs={**source_kwargs, "session": self.session},
+            summarizer=self.summarizer
+        )
+
+    def _summarize_day(self, article_summaries: List[str]) -> Optional[str]:
+        """Generate one edition's daily overview, logging any failure.
+
+        Args:
+            article_summaries: The edition's article summaries
+
+        Returns:
+            Daily overview, or None if it could not be generated
+        """
+        try:
+            return self.summarizer.summarize_day(article_summaries)
+        except Exception as e:
+            logger.warning(f"Failed to generate daily overview: {str(e)}")
+            return None
+
+    def _summarize(
+        self,
+        generators: Dict[str, NewsDigestGenerator],
+        stories: Dict[str, List[Dict[str, str]]],
+        executor: ThreadPoolExecutor
+    ) -> Dict[str, Tuple[List[str], Optional[str]]]:
+        """Summarize every edition's articles, then every edition's day, on the shared pool.
+
+        Args:
+            generators: Generators by edition name
+            stories: Fetched stories by edition name
+            executor: Shared worker pool
+
+        Returns:
+            Article summaries and daily overview by edition name
+        """
+        pairs = [
+            (name, story) for name, edition_stories in stories.items() for story in edition_stories
+        ]
+        summaries = executor.map(lambda pair: generators[pair[0]].summarize_story(pair[1]), pairs)
+
+        article_summaries: Dict[str, List[str]] = {name: [] for name in stories}
+        for (name, _), summary in zip(pairs, summaries):
+            article_summaries[name].append(summary)
+
+        overviews = executor.map(self._summarize_day, article_summaries.values())
+        return {
+            name: (article_summaries[name], overview)
+            for name, overview in zip(article_summaries, overviews)
+        }
+
+    def run(self, date: Optional[datetime] = None, force: bool = False) -> Dict[str, str]:
+        """Generate the digest for every edition.
+
+        All feeds are fetched concurrently, then all articles across editions
+        are summarized concurrently, then the daily overviews, so the run takes
+        about as long as its slowest edition rather than the sum of them. In
+        batch mode the articles of all editions share one batch and the
+        overviews a second one; an interrupted run resumes with the stories
+        it was submitted with instead of fetching the feeds again.
+
+        Args:
+            date: Optional datetime object (defaults to today)
+            force: Whether to overwrite existing digests (default: False)
+
+        Returns:
+            Mapping of edition name to STATUS_GENERATED, STATUS_SKIPPED or STATUS_FAILED
+        """
+        date = date or datetime.now()
+        run_key = os.path.join(self.output_root, date.strftime('%Y-%m-%d'))
+        saved_stories = self.batch.load_stories(run_key) if self.batch else None
+
+        statuses: Dict[str, str] = {}
+        generators: Dict[str, NewsDigestGenerator] = {}
+        for edition in self.editions:
+            name = edition["name"]
+            generator = self._create_generator(edition)
+            resuming = saved_stories is not None and name in saved_stories
+            if not resuming and not force and os.path.exists(generator.get_file_path(date)):
+                logger.info(f"Digest already exists for edition {name}")
+                statuses[name] = STATUS_SKIPPED
+                continue
+            if saved_stories is not None and not resuming:
+                logger.error(
+                    f"Edition {name} is not part of the pending batch run; rerun once it finishes"
+                )
+                statuses[name] = STATUS_FAILED
+                continue
+            generators[name] = generator
+
+        if self.use_llm:
+            self.summarizer.reset_run()
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            if saved_stories is not None:
+                fetched = [saved_stories[name] for name in generators]
+            else:
+                fetched = executor.map(
+                    lambda generator: generator.fetch_stories(), generators.values()
+                )
+            stories = {}
+            for name, edition_stories in zip(generators, fetched):
+                if edition_stories:
+                    stories[name] = edition_stories
+                else:
+                    logger.error(f"No stories fetched for edition {name}")
+                    statuses[name] = STATUS_FAILED
+
+            summaries = {}
+            if self.batch and stories:
+                # One shared article batch and one daily batch for every edition
+                try:
+                    summaries = self.batch.summarize(run_key, stories)
+                except Exception as e:
+                    logger.error(f"Batch summarization failed, rerun to resume: {str(e)}")
+                    statuses.update({name: STATUS_FAILED for name in stories})
+                    stories = {}
+            elif self.use_llm:
+                summaries = self._summarize(generators, stories, executor)
+
+        for name, edition_stories in stories.items():
+            generator = generators[name]
+            file_path = generator.get_file_path(date)
+            article_summaries, daily_overview = summaries.get(name, (None, None))
+            try:
+                markdown = generator.generate_markdown(
+                    edition_stories, date, article_summaries, daily_overview
+                )
+                generator.write_digest(file_path, markdown)
+            except Exception as e:
+                logger.error(f"Failed to generate or write edition {name}: {str(e)}")
+                statuses[name] = STATUS_FAILED
+                continue
+            logger.info(f"Generated digest at {file_path}")
+            statuses[name] = STATUS_GENERATED
+
+        if self.batch and stories and STATUS_FAILED not in (statuses[name] for name in stories):
+            self.batch.clear(run_key)
+        if self.use_llm:
+            self.summarizer.log_call_report()
+        return {edition["name"]: statuses[edition["name"]] for edition in self.editions}
@@ -5,10 +5,11 @@ This module orchestrates the generation of markdown files from news sources.
 """
 
 from datetime import datetime
-from typing import List, Dict, Optional, Type
+from typing import Any, List, Dict, Optional, Type
 import logging
 import os
 
+from .batch import BatchSummarizer
 from .sources.base import NewsSource
 from .sources.google_news import GoogleNewsScraper
 from .summarizer import LLMSummarizer
@@ -26,7 +27,16 @@ class NewsDigestGenerator:
         use_llm: bool = True,
         llm_model: str = "gpt-4o",
         llm_temperature: float = 0.5,
-        output_dir: str = "content"
+        output_dir: str = "content",
+        article_model: Optional[str] = None,
+        daily_model: Optional[str] = None,
+        article_latency_budget: Optional[float] = None,
+        daily_latency_budget: Optional[float] = None,
+        source_kwargs: Optional[Dict[str, Any]] = None,
+        summarizer: Optional[LLMSummarizer] = None,
+        batch_dir: Optional[str] = None,
+        batch_poll_interval: float = 60.0,
+        llm_base_url: Optional[str] = None
     ):
         """Initialize the generator.
         
@@ -37,22 +47,51 @@ class NewsDigestGenerator:
             llm_model: OpenAI model to use (default: gpt-4o)
             llm_temperature: Model temperature (default: 0.5)
             output_dir: Directory for output files (default: "content")
+            article_model: Model for per-article summaries (default: llm_model)
+            daily_model: Model for the daily overview (default: llm_model)
+            article_latency_budget: Seconds before an article call falls back to
+                daily_model (default: None, no budget)
+            daily_latency_budget: Seconds before an overview call falls back to
+                article_model (default: None, no budget)
+            source_kwargs: Extra keyword arguments for source_class (default: None)
+            summarizer: Existing summarizer to share across generators; the llm_*
+                and model options are ignored when given (default: None)
+            batch_dir: Summarize through the OpenAI Batch API, keeping resume state
+                in this directory (default: None, synchronous calls)
+            batch_poll_interval: Seconds between batch status checks (default: 60)
+            llm_base_url: OpenAI API base URL, e.g. a local stand-in server
+                (default: None, OPENAI_BASE_URL or the OpenAI API)
         """
         self.output_dir = output_dir
-        self.news_source = source_class(max_stories=max_stories)
+        self.news_source = source_class(max_stories=max_stories, **(source_kwargs or {}))
         self.use_llm = use_llm
         
-        if use_llm:
+        if use_llm and summarizer:
+            self.summarizer = summarizer
+        elif use_llm:
             try:
                 self.summarizer = LLMSummarizer(
                     model=llm_model,
-                    temperature=llm_temperature
+                    temperature=llm_temperature,
+                    article_model=article_model,
+                    daily_model=daily_model,
+                    article_latency_budget=article_latency_budget,
+                    daily_latency_budget=daily_latency_budget,
+                    base_url=llm_base_url
                 )
             except ValueError as e:
                 logger.warning(f"Failed to initialize LLM summarizer: {str(e)}")
                 self.use_llm = False
+        
+        self.batch = None
+        if self.use_llm and batch_dir:
+            self.batch = BatchSummarizer(
+                self.summarizer,
+                state_dir=batch_dir,
+                poll_interval=batch_poll_interval
+            )
     
-    def _get_file_path(self, date: datetime) -> str:
+    def get_file_path(self, date: datetime) -> str:
         """Get the file path for a given date's digest.
         
         Args:
@@ -66,12 +105,38 @@ class NewsDigestGenerator:
             f"{date.strftime('%Y-%m-%d')}.md"
         )
     
-    def generate_markdown(self, stories: List[Dict[str, str]], date: Optional[datetime] = None) -> str:
+    def summarize_story(self, story: Dict[str, str]) -> str:
+        """Summarize a single story.
+        
+        Args:
+            story: Story dictionary
+            
+        Returns:
+            Summary text, or "No summary available." if it could not be generated
+        """
+        summary = None
+        if story.get('summary'):
+            try:
+                summary = self.summarizer.summarize_article(story['summary'])
+            except Exception as e:
+                logger.warning(f"Failed to summarize article: {str(e)}")
+        return summary or "No summary available."
+    
+    def generate_markdown(
+        self,
+        stories: List[Dict[str, str]],
+        date: Optional[datetime] = None,
+        article_summaries: Optional[List[str]] = None,
+        daily_overview: Optional[str] = None
+    ) -> str:
         """Generate markdown content from stories.
         
         Args:
             stories: List of story dictionaries
             date: Optional datetime object (defaults to today)
+            article_summaries: Precomputed summaries, one per story; when given,
+                no LLM calls are made (default: None)
+            daily_overview: Precomputed daily overview used with article_summaries (default: None)
             
         Returns:
             Markdown formatted string
@@ -79,21 +144,15 @@ class NewsDigestGenerator:
         date = date or datetime.now()
         formatted_date = utils.format_date_for_title(date)
         
-        # Generate article summaries if LLM is enabled
-        article_summaries = []
-        if self.use_llm:
-            for story in stories:
-                summary = None
-                if story.get('summary'):
-                    try:
-                        summary = self.summarizer.summarize_article(story['summary'])
-                    except Exception as e:
-                        logger.warning(f"Failed to summarize article: {str(e)}")
-                article_summaries.append(summary or "No summary available.")
+        # Generate article summaries if LLM is enabled and none were precomputed
+        precomputed = article_summaries is not None
+        article_summaries = article_summaries or []
+        if self.use_llm and not precomputed:
+            self.summarizer.reset_run()
+            article_summaries = [self.summarize_story(story) for story in stories]
         
         # Generate daily overview if LLM is enabled
-        daily_overview = None
-        if self.use_llm and article_summaries:
+        if self.use_llm and not precomputed and article_summaries:
             try:
                 daily_overview = self.summarizer.summarize_day(article_summaries)
             except Exception as e:
@@ -148,6 +207,33 @@ class NewsDigestGenerator:
         
         return "\n".join(content)
     
+    def fetch_stories(self) -> List[Dict[str, str]]:
+        """Fetch stories from the news source, logging any failure.
+        
+        Returns:
+            List of story dictionaries, empty if none could be fetched
+        """
+        try:
+            stories = self.news_source.get_stories()
+        except Exception as e:
+            logger.error(f"Failed to fetch stories: {str(e)}")
+            return []
+        
+        if not stories:
+            logger.error("No stories found")
+        return stories
+    
+    def write_digest(self, file_path: str, markdown: str) -> None:
+        """Write a digest, creating the output directory if needed.
+        
+        Args:
+            file_path: Path to the markdown file
+            markdown: Markdown content
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        with open(file_path, 'w') as f:
+            f.write(markdown)
+    
     def generate_digest(self, date: Optional[datetime] = None, force: bool = False) -> bool:
         """Generate a news digest for the specified date.
         
@@ -159,34 +245,42 @@ class NewsDigestGenerator:
             True if digest was generated, False otherwise
         """
         date = date or datetime.now()
-        file_path = self._get_file_path(date)
+        file_path = self.get_file_path(date)
         
         # Check if digest already exists
         if not force and os.path.exists(file_path):
             logger.info(f"Digest already exists for {date.strftime('%Y-%m-%d')}")
+            # A crash after writing the digest can leave its finished batch run behind
+            if self.batch:
+                self.batch.clear(file_path)
             return False
         
-        # Ensure output directory exists
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        # Fetch stories
-        try:
-            stories = self.news_source.get_stories()
-            if not stories:
-                logger.error("No stories found")
-                return False
-        except Exception as e:
-            logger.error(f"Failed to fetch stories: {str(e)}")
+        # Fetch stories, reusing the ones a pending batch run was submitted with
+        saved_stories = self.batch.load_stories(file_path) if self.batch else None
+        stories = (saved_stories or {}).get(date.strftime('%Y-%m-%d')) or self.fetch_stories()
+        if not stories:
             return False
         
         # Generate and write markdown
         try:
-            markdown = self.generate_markdown(stories, date)
-            with open(file_path, 'w') as f:
-                f.write(markdown)
+            if self.batch:
+                # Blocks until the batches complete; a rerun resumes them if interrupted
+                self.summarizer.reset_run()
+                digest_key = date.strftime('%Y-%m-%d')
+                summaries = self.batch.summarize(file_path, {digest_key: stories})
+                markdown = self.generate_markdown(stories, date, *summaries[digest_key])
+            else:
+                markdown = self.generate_markdown(stories, date)
+            self.write_digest(file_path, markdown)
         except Exception as e:
             logger.error(f"Failed to generate or write digest: {str(e)}")
+            if self.use_llm:
+                self.summarizer.log_call_report()
             return False
         
+        if self.batch:
+            self.batch.clear(file_path)
+        if self.use_llm:
+            self.summarizer.log_call_report()
         logger.info(f"Generated digest at {file_path}")
         return True 
\ No newline at end of file
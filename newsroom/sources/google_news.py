@@ -22,13 +22,43 @@ class GoogleNewsScraper(NewsSource):
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
 
-    def __init__(self, max_stories: int = 10):
+    def __init__(
+        self,
+        max_stories: int = 10,
+        hl: Optional[str] = None,
+        gl: Optional[str] = None,
+        ceid: Optional[str] = None,
+        topic: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """Initialize the scraper.
         
         Args:
             max_stories: Maximum number of stories to fetch (default: 10)
+            hl: Interface language, e.g. "en-GB" (default: None, feed default)
+            gl: Country code, e.g. "GB" (default: None, feed default)
+            ceid: Country and language edition, e.g. "GB:en" (default: None, feed default)
+            topic: Topic section such as "BUSINESS" (default: None, top stories)
+            session: Shared HTTP session to reuse connections (default: new session)
         """
         self.max_stories = max_stories
+        self.topic = topic
+        self.params = {
+            key: value
+            for key, value in (("hl", hl), ("gl", gl), ("ceid", ceid))
+            if value
+        }
+        self.session = session or requests.Session()
+
+    def _get_feed_url(self) -> str:
+        """Get the RSS feed URL for the configured topic.
+        
+        Returns:
+            Top stories feed URL, or the topic section feed URL if a topic is set
+        """
+        if self.topic:
+            return f"{self.BASE_URL}/headlines/section/topic/{self.topic}"
+        return self.BASE_URL
 
     def _parse_story_item(self, item) -> Optional[Dict[str, str]]:
         """Parse a single RSS item into a story dictionary.
@@ -73,7 +103,11 @@ class GoogleNewsScraper(NewsSource):
             List of story dictionaries
         """
         try:
-            response = requests.get(self.BASE_URL, headers=self.HEADERS)
+            response = self.session.get(
+                self._get_feed_url(),
+                params=self.params,
+                headers=self.HEADERS
+            )
             response.raise_for_status()
             
             # Parse RSS feed with lxml-xml parser
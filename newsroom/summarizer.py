@@ -3,16 +3,30 @@ LLM-based summarization using OpenAI's API.
 """
 
 import os
+import time
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI, OpenAIError
+from openai import APITimeoutError, OpenAI, OpenAIError
+
+from .tiering import CallReport, ModelTiers
 
 logger = logging.getLogger(__name__)
 
 class LLMSummarizer:
-    """Handles article and daily digest summarization using OpenAI."""
+    """Handles article and daily digest summarization using OpenAI.
+
+    Each stage (per-article summaries and the daily overview) has its own
+    model tier. When a call to a stage's primary model errors or exceeds the
+    stage's latency budget, the call is retried on the other stage's model. If
+    the primary model looks unavailable (timeouts, connection errors, 429 and
+    5xx responses), the stage keeps using the other model first until the run
+    is reset.
+    """
+    
+    STAGE_ARTICLE = "article"
+    STAGE_DAILY = "daily"
     
     # Default prompts for summarization
     ARTICLE_PROMPT = (
@@ -33,15 +47,28 @@ class LLMSummarizer:
         model: str = "gpt-4o",
         article_max_tokens: int = 150,
         daily_max_tokens: int = 200,
-        temperature: float = 0.5
+        temperature: float = 0.5,
+        article_model: Optional[str] = None,
+        daily_model: Optional[str] = None,
+        article_latency_budget: Optional[float] = None,
+        daily_latency_budget: Optional[float] = None,
+        base_url: Optional[str] = None
     ):
         """Initialize the summarizer.
         
         Args:
-            model: OpenAI model to use (default: gpt-4o)
+            model: OpenAI model to use for any stage without its own model (default: gpt-4o)
             article_max_tokens: Max tokens for article summaries (default: 150)
             daily_max_tokens: Max tokens for daily overview (default: 200)
             temperature: Model temperature (default: 0.5)
+            article_model: Model for per-article summaries (default: model)
+            daily_model: Model for the daily overview (default: model)
+            article_latency_budget: Seconds an article call on article_model may take
+                before falling back to daily_model (default: None, no budget)
+            daily_latency_budget: Seconds an overview call on daily_model may take
+                before falling back to article_model (default: None, no budget)
+            base_url: API base URL, e.g. a local stand-in server
+                (default: None, OPENAI_BASE_URL or the OpenAI API)
         """
         # Load environment variables
         load_dotenv()
@@ -51,50 +78,155 @@ class LLMSummarizer:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
             
         self.model = model
+        self.article_model = article_model or model
+        self.daily_model = daily_model or model
+        self.tiers = ModelTiers(
+            {self.STAGE_ARTICLE: self.article_model, self.STAGE_DAILY: self.daily_model},
+            {self.STAGE_ARTICLE: article_latency_budget, self.STAGE_DAILY: daily_latency_budget}
+        )
+        self.report = CallReport()
+        # Article summaries keyed by article text, shared by every digest using this summarizer
+        self.article_cache: Dict[str, Tuple[str, str]] = {}
         self.article_max_tokens = article_max_tokens
         self.daily_max_tokens = daily_max_tokens
         self.temperature = temperature
         
+        has_budget = any(budget is not None for budget in self.tiers.latency_budgets.values())
+        if has_budget and self.article_model == self.daily_model:
+            logger.warning(
+                f"Latency budgets have no effect: both stages use "
+                f"{self.article_model}, so there is no fallback model"
+            )
+        
         try:
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, base_url=base_url)
         except Exception as e:
             raise ValueError(f"Failed to initialize OpenAI client: {str(e)}")
             
+    def reset_run(self) -> None:
+        """Clear the call report and return every stage to its primary tier."""
+        self.report.clear()
+        self.tiers.reset()
+        
+    def log_call_report(self) -> None:
+        """Log which model tier served each call recorded since the last reset."""
+        self.report.log()
+    
+    def _request_completion(
+        self,
+        model: str,
+        prompt: str,
+        content: str,
+        max_tokens: int,
+        timeout: Optional[float]
+    ) -> str:
+        """Send a single chat completion request.
+        
+        Args:
+            model: OpenAI model to use
+            prompt: System prompt for the model
+            content: User content to process
+            max_tokens: Maximum tokens in response
+            timeout: Request timeout in seconds, or None for the client default
+            
+        Returns:
+            Generated text
+            
+        Raises:
+            OpenAIError: If the request fails or times out
+        """
+        client = self.client
+        if timeout is not None:
+            # Retrying inside the budget would only stretch the latency further
+            client = self.client.with_options(timeout=timeout, max_retries=0)
+        
+        response = client.chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": prompt},
+                {"role": "user", "content": content}
+            ],
+            max_tokens=max_tokens,
+            temperature=self.temperature
+        )
+        return response.choices[0].message.content.strip()
+    
     def _generate_completion(
         self,
         prompt: str,
         content: str,
-        max_tokens: int
-    ) -> Optional[str]:
-        """Generate a completion using OpenAI's API.
+        max_tokens: int,
+        stage: str
+    ) -> Tuple[Optional[str], Optional[str]]:
+        """Generate a completion, falling back to the alternate tier on failure.
         
         Args:
             prompt: System prompt for the model
             content: User content to process
             max_tokens: Maximum tokens in response
+            stage: STAGE_ARTICLE or STAGE_DAILY
             
         Returns:
-            Generated text or None if generation fails
+            Generated text and the model that served it, or (None, None) if every tier fails
         """
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": prompt},
-                    {"role": "user", "content": content}
-                ],
-                max_tokens=max_tokens,
-                temperature=self.temperature
-            )
-            return response.choices[0].message.content.strip()
+        tiers = self.tiers.get_tiers(stage)
+        for index, (tier, model) in enumerate(tiers):
+            is_last = index == len(tiers) - 1
+            alternate = tiers[index + 1][1] if not is_last else None
+            # Only the primary tier is held to the budget, and only while a fallback remains
+            budget = self.tiers.latency_budgets[stage]
+            timeout = budget if tier == "primary" and not is_last else None
+            started = time.monotonic()
             
-        except OpenAIError as e:
-            logger.warning(f"OpenAI API error: {str(e)}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error during completion: {str(e)}")
-            return None
+            try:
+                text = self._request_completion(model, prompt, content, max_tokens, timeout)
+            except APITimeoutError as e:
+                self.report.record(stage, tier, model, time.monotonic() - started, "timeout")
+                logger.warning(f"{stage} call on {model} exceeded latency budget of {budget}s")
+                self.tiers.degrade(stage, tier, alternate, e)
+                continue
+            except OpenAIError as e:
+                self.report.record(stage, tier, model, time.monotonic() - started, "error")
+                logger.warning(f"OpenAI API error on {model}: {str(e)}")
+                self.tiers.degrade(stage, tier, alternate, e)
+                continue
+            except Exception as e:
+                self.report.record(stage, tier, model, time.monotonic() - started, "error")
+                logger.error(f"Unexpected error during completion on {model}: {str(e)}")
+                continue
+            
+            self.report.record(stage, tier, model, time.monotonic() - started, "ok")
+            return text, model
+        
+        return None, None
+    
+    def format_article_content(self, content: str) -> str:
+        """Build the user message for an article summary request.
+        
+        Args:
+            content: The article text to summarize
+            
+        Returns:
+            User message content
+        """
+        return f"Summarize this news article:\n\n{content}"
+    
+    def format_daily_content(self, summaries: List[str]) -> str:
+        """Build the user message for a daily overview request.
+        
+        Args:
+            summaries: List of article summaries to synthesize
             
+        Returns:
+            User message content
+        """
+        # Combine summaries into a single text
+        combined = "\n\n".join([f"- {s}" for s in summaries if s])
+        return (
+            "Create a brief overview of today's top stories based on these "
+            f"summaries:\n\n{combined}"
+        )
+    
     def summarize_article(self, content: str) -> Optional[str]:
         """Generate a concise summary of a news article.
         
@@ -104,11 +236,21 @@ class LLMSummarizer:
         Returns:
             A 2-3 sentence summary, or None if summarization fails
         """
-        return self._generate_completion(
+        cached = self.article_cache.get(content)
+        if cached:
+            summary, model = cached
+            self.report.record(self.STAGE_ARTICLE, "cache", model, 0.0, "ok")
+            return summary
+        
+        summary, model = self._generate_completion(
             prompt=self.ARTICLE_PROMPT,
-            content=f"Summarize this news article:\n\n{content}",
-            max_tokens=self.article_max_tokens
+            content=self.format_article_content(content),
+            max_tokens=self.article_max_tokens,
+            stage=self.STAGE_ARTICLE
         )
+        if summary:
+            self.article_cache[content] = (summary, model)
+        return summary
             
     def summarize_day(self, summaries: List[str]) -> Optional[str]:
         """Generate a daily overview from multiple article summaries.
@@ -121,12 +263,11 @@ class LLMSummarizer:
         """
         if not summaries:
             return None
-            
-        # Combine summaries into a single text
-        combined = "\n\n".join([f"- {s}" for s in summaries if s])
         
-        return self._generate_completion(
+        overview, _ = self._generate_completion(
             prompt=self.DAILY_PROMPT,
-            content=f"Create a brief overview of today's top stories based on these summaries:\n\n{combined}",
-            max_tokens=self.daily_max_tokens
-        ) 
\ No newline at end of file
+            content=self.format_daily_content(summaries),
+            max_tokens=self.daily_max_tokens,
+            stage=self.STAGE_DAILY
+        )
+        return overview 
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Model tier selection and call reporting for LLMSummarizer.
+"""
+
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+from openai import APIConnectionError, APIStatusError
+
+logger = logging.getLogger(__name__)
+
+class ModelTiers:
+    """Chooses which model serves each stage's calls.
+
+    Each stage's primary tier is its own model and its fallback tier is the
+    other stage's model. Once a stage's primary model looks unavailable, the
+    stage tries its fallback tier first until the run is reset.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, str],
+        latency_budgets: Dict[str, Optional[float]]
+    ):
+        """Initialize the tiers.
+
+        Args:
+            models: Primary model by stage
+            latency_budgets: Seconds a primary tier call may take by stage, or None
+                for no budget
+        """
+        self.models = models
+        self.latency_budgets = latency_budgets
+        # Stages whose primary tier failed this run and now try the fallback tier first
+        self.degraded_stages: Set[str] = set()
+
+    def get_tiers(self, stage: str) -> List[Tuple[str, str]]:
+        """Get the ordered (tier, model) pairs to try for a stage.
+
+        Args:
+            stage: Stage to get the tiers for
+
+        Returns:
+            Primary tier first, followed by the fallback tier if it uses a different
+            model; the order is swapped once the stage's primary tier has failed
+        """
+        primary = self.models[stage]
+        alternates = [model for model in self.models.values() if model != primary]
+        if not alternates:
+            return [("primary", primary)]
+        if stage in self.degraded_stages:
+            return [("fallback", alternates[0]), ("primary", primary)]
+        return [("primary", primary), ("fallback", alternates[0])]
+
+    def degrade(
+        self,
+        stage: str,
+        tier: str,
+        alternate: Optional[str],
+        error: Exception
+    ) -> None:
+        """Prefer the fallback tier for a stage after its primary tier became unavailable.
+
+        Only timeouts, connection errors, 429 and 5xx responses switch the stage.
+        Request-specific failures, such as a 400 for one oversized article, only
+        fall back for that call and leave the stage on its primary tier.
+
+        Args:
+            stage: Stage the failed call was made for
+            tier: Tier of the failed call
+            alternate: Model of the next tier, or None if there is none
+            error: Exception raised by the failed call
+        """
+        unavailable = isinstance(error, APIConnectionError) or (
+            isinstance(error, APIStatusError)
+            and (error.status_code == 429 or error.status_code >= 500)
+        )
+        if not unavailable or tier != "primary" or alternate is None:
+            return
+        if stage in self.degraded_stages:
+            return
+        self.degraded_stages.add(stage)
+        logger.warning(f"Switching {stage} calls to {alternate} for the rest of this run")
+
+    def reset(self) -> None:
+        """Return every stage to its primary tier."""
+        self.degraded_stages.clear()
+
+class CallReport:
+    """Records which model tier served each call of a run."""
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.calls: List[Dict[str, object]] = []
+
+    def record(self, stage: str, tier: str, model: str, latency: float, status: str) -> None:
+        """Record a completion attempt.
+
+        Args:
+            stage: Stage the call was made for
+            tier: "primary", "fallback", "cache" or "batch"
+            model: Model that handled the call
+            latency: Call duration in seconds
+            status: "ok", "timeout" or "error"
+        """
+        self.calls.append({
+            "stage": stage,
+            "tier": tier,
+            "model": model,
+            "latency": latency,
+            "status": status
+        })
+
+    def format_lines(self) -> List[str]:
+        """Format the recorded calls as report lines, one per call.
+
+        Returns:
+            Lines like "article: primary (gpt-4o-mini) ok in 0.84s"
+        """
+        return [
+            f"{call['stage']}: {call['tier']} ({call['model']}) "
+            f"{call['status']} in {call['latency']:.2f}s"
+            for call in self.calls
+        ]
+
+    def log(self) -> None:
+        """Log the recorded calls, if any."""
+        if not self.calls:
+            return
+
+        logger.info("LLM call report:")
+        for line in self.format_lines():
+            logger.info(f"  {line}")
+
+    def clear(self) -> None:
+        """Forget the recorded calls."""
+        self.calls.clear()
@@ -6,10 +6,17 @@ CLI script to generate news digests.
 import argparse
 import logging
 from datetime import datetime
+from typing import Optional
+import os
 import sys
 
+from newsroom.editions import STATUS_FAILED, EditionRunner, load_editions
 from newsroom.generator import NewsDigestGenerator
 
+# src/content/config.ts registers one Astro collection per edition in this file
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+EDITIONS_CONFIG = os.path.join(REPO_ROOT, "editions.json")
+
 def setup_logging(verbose: bool = False) -> None:
     """Configure logging with appropriate level and format.
     
@@ -38,6 +45,46 @@ def parse_date(date_str: str) -> datetime:
     except ValueError:
         raise ValueError("Invalid date format. Use YYYY-MM-DD")
 
+def run_editions(args: argparse.Namespace, target_date: Optional[datetime]) -> None:
+    """Generate every configured edition and exit.
+    
+    Args:
+        args: Parsed command line arguments
+        target_date: Date to generate digests for, or None for today
+    """
+    if os.path.abspath(args.editions) != EDITIONS_CONFIG:
+        logging.warning(
+            f"Astro collections are only registered for editions in {EDITIONS_CONFIG}; "
+            f"editions only listed in {args.editions} will not appear on the site"
+        )
+    
+    try:
+        editions = load_editions(args.editions)
+        runner = EditionRunner(
+            editions,
+            output_root=args.output_dir or "src/content",
+            max_stories=args.stories,
+            use_llm=not args.no_llm,
+            workers=args.workers,
+            batch_dir=args.batch_dir if args.batch else None,
+            batch_poll_interval=args.poll_interval,
+            model=args.model,
+            temperature=args.temperature,
+            article_model=args.article_model,
+            daily_model=args.daily_model,
+            article_latency_budget=args.article_latency_budget,
+            daily_latency_budget=args.daily_latency_budget,
+            base_url=args.api_base
+        )
+        statuses = runner.run(date=target_date, force=args.force)
+    except Exception as e:
+        logging.error(f"Failed to generate editions: {str(e)}")
+        sys.exit(1)
+    
+    for name, status in statuses.items():
+        logging.info(f"  {name}: {status}")
+    sys.exit(1 if STATUS_FAILED in statuses.values() else 0)
+
 def main():
     """Main entry point for the generator CLI."""
     parser = argparse.ArgumentParser(
@@ -60,6 +107,18 @@ Examples:
   # Customize output directory
   python scripts/generate.py --output-dir src/content/digests
   
+  # Use a small model per article and a larger one for the overview; article
+  # calls taking longer than 5 seconds fall back to the larger model
+  python scripts/generate.py --article-model gpt-4o-mini --daily-model gpt-4o \
+      --article-latency-budget 5
+  
+  # Generate every edition listed in editions.json into src/content/<edition>/
+  python scripts/generate.py --editions
+  
+  # Backfill a past date through the cheaper OpenAI Batch API; rerunning the
+  # same command after an interruption resumes the submitted batches
+  python scripts/generate.py --date 2025-06-07 --batch
+  
   # Adjust model temperature
   python scripts/generate.py --temperature 0.7
 """
@@ -90,6 +149,24 @@ Examples:
         default="gpt-4o",
         help="OpenAI model to use for summarization (default: gpt-4o, ignored if --no-llm is set)"
     )
+    parser.add_argument(
+        "--article-model",
+        help="Model for per-article summaries (default: --model)"
+    )
+    parser.add_argument(
+        "--daily-model",
+        help="Model for the daily overview (default: --model)"
+    )
+    parser.add_argument(
+        "--article-latency-budget",
+        type=float,
+        help="Seconds an article call may take before falling back to --daily-model"
+    )
+    parser.add_argument(
+        "--daily-latency-budget",
+        type=float,
+        help="Seconds an overview call may take before falling back to --article-model"
+    )
     parser.add_argument(
         "--temperature",
         type=float,
@@ -98,8 +175,42 @@ Examples:
     )
     parser.add_argument(
         "--output-dir",
-        default="content",
-        help="Directory for output files (default: content)"
+        help="Directory for output files (default: content, or src/content with --editions)"
+    )
+    parser.add_argument(
+        "--editions",
+        nargs="?",
+        const=EDITIONS_CONFIG,
+        help=(
+            "Generate every edition in a JSON config, one subdirectory each "
+            "(default: editions.json)"
+        )
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent summarization workers shared by all editions (default: 4)"
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Summarize through the OpenAI Batch API (slower, cheaper, resumable)"
+    )
+    parser.add_argument(
+        "--batch-dir",
+        default=".batch",
+        help="Directory for batch input files and resume state (default: .batch)"
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between batch status checks (default: 60)"
+    )
+    parser.add_argument(
+        "--api-base",
+        help="OpenAI API base URL, e.g. a local stand-in server (default: OPENAI_BASE_URL)"
     )
     parser.add_argument(
         "--verbose", "-v",
@@ -126,12 +237,21 @@ Examples:
         logging.debug("Configuration:")
         logging.debug(f"  Date: {args.date or 'today'}")
         logging.debug(f"  Stories: {args.stories}")
-        logging.debug(f"  Output Directory: {args.output_dir}")
+        logging.debug(f"  Output Directory: {args.output_dir or 'default'}")
+        logging.debug(f"  Editions: {args.editions or 'none'}")
         logging.debug(f"  LLM Enabled: {not args.no_llm}")
         if not args.no_llm:
             logging.debug(f"  Model: {args.model}")
+            logging.debug(f"  Article Model: {args.article_model or args.model}")
+            logging.debug(f"  Daily Model: {args.daily_model or args.model}")
+            logging.debug(f"  Article Latency Budget: {args.article_latency_budget or 'none'}")
+            logging.debug(f"  Daily Latency Budget: {args.daily_latency_budget or 'none'}")
+            logging.debug(f"  Batch Mode: {args.batch}")
             logging.debug(f"  Temperature: {args.temperature}")
     
+    if args.editions:
+        run_editions(args, target_date)
+    
     try:
         # Generate digest
         generator = NewsDigestGenerator(
@@ -139,7 +259,14 @@ Examples:
             use_llm=not args.no_llm,
             llm_model=args.model,
             llm_temperature=args.temperature,
-            output_dir=args.output_dir
+            output_dir=args.output_dir or "content",
+            article_model=args.article_model,
+            daily_model=args.daily_model,
+            article_latency_budget=args.article_latency_budget,
+            daily_latency_budget=args.daily_latency_budget,
+            llm_base_url=args.api_base,
+            batch_dir=args.batch_dir if args.batch else None,
+            batch_poll_interval=args.poll_interval
         )
         success = generator.generate_digest(
             date=target_date,
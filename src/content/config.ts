@@ -1,4 +1,5 @@
 import { defineCollection, z } from 'astro:content';
+import editionsConfig from '../../editions.json';
 
 const digestCollection = defineCollection({
   type: 'content',
@@ -14,6 +15,12 @@ const digestCollection = defineCollection({
   }),
 });
 
+// Each edition generated by `scripts/generate.py --editions` gets its own collection
+const editionCollections = Object.fromEntries(
+  editionsConfig.editions.map((edition) => [edition.name, digestCollection])
+);
+
 export const collections = {
   'digests': digestCollection,
+  ...editionCollections,
 }; 
\ No newline at end of file
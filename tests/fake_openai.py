@@ -0,0 +1,229 @@
+"""
+Local stand-in for the OpenAI files and batches endpoints, served over HTTP.
+
+Point a real OpenAI client at FakeOpenAIServer.url to exercise the SDK's
+requests, response parsing and pagination. Batches complete after a
+configurable number of status checks. Each request is answered with its model
+name and the last line of its user message, so tests can check which result
+was mapped to which story.
+"""
+
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+import json
+import threading
+
+class ProcessKilled(BaseException):
+    """Simulates the process dying; not caught by the code under test."""
+
+class FakeOpenAIServer:
+    """HTTP server implementing files.create/content and batches.create/retrieve/list."""
+
+    def __init__(self, polls_until_complete: int = 1, page_size: int = 2):
+        """Initialize the server without starting it.
+
+        Args:
+            polls_until_complete: Status checks a batch stays in progress for (default: 1)
+            page_size: Largest page returned when listing batches, kept small so
+                that clients have to paginate (default: 2)
+        """
+        self.polls_until_complete = polls_until_complete
+        self.page_size = page_size
+        self.uploads: Dict[str, str] = {}
+        self.outputs: Dict[str, str] = {}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self.batch_records: Dict[str, Dict[str, Any]] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.corrupt_output = False
+        # Requests whose user message contains one of these end up in the error file
+        self.failing_contents: List[str] = []
+        self.clock = 1_700_000_000
+        self.lock = threading.Lock()
+        self.httpd: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass to the OpenAI client."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def created_requests(self) -> List[List[Dict[str, Any]]]:
+        """Requests of every batch created from an upload, in creation order."""
+        return [
+            [json.loads(line) for line in self.uploads[record["input_file_id"]].splitlines()]
+            for record in self.batch_records.values()
+            if record["input_file_id"] in self.uploads
+        ]
+
+    def start(self) -> None:
+        """Serve requests on a free localhost port from a background thread."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.handle(self, "GET")
+
+            def do_POST(self) -> None:
+                server.handle(self, "POST")
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        """Shut the server down."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def add_batch(self, input_file_id: str = "file-unrelated") -> str:
+        """Create a batch directly, as another job sharing the account would.
+
+        Args:
+            input_file_id: Input file the batch claims to be created from
+
+        Returns:
+            ID of the batch
+        """
+        with self.lock:
+            return self._create_batch(input_file_id)
+
+    def handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        """Route one HTTP request and write its JSON or text response.
+
+        Args:
+            handler: Request handler of the connection
+            method: "GET" or "POST"
+        """
+        url = urlparse(handler.path)
+        parts = url.path.strip("/").split("/")[1:]
+        body = handler.rfile.read(int(handler.headers.get("Content-Length") or 0))
+        with self.lock:
+            self.requests.append((method, url.path))
+            if method == "POST" and parts == ["files"]:
+                response: Any = self._upload(handler.headers["Content-Type"], body)
+            elif method == "GET" and len(parts) == 3 and parts[0] == "files":
+                response = self.outputs.get(parts[1], self.uploads.get(parts[1]))
+            elif method == "POST" and parts == ["batches"]:
+                response = self._batch(self._create_batch(json.loads(body)["input_file_id"]))
+            elif method == "GET" and len(parts) == 2 and parts[0] == "batches":
+                self.batch_records[parts[1]]["polls"] += 1
+                response = self._batch(parts[1])
+            elif method == "GET" and parts == ["batches"]:
+                response = self._list_batches(parse_qs(url.query))
+            else:
+                response = None
+
+        if response is None:
+            handler.send_response(404)
+            payload = json.dumps({"error": {"message": f"No route for {url.path}"}}).encode()
+        else:
+            handler.send_response(200)
+            is_text = isinstance(response, str)
+            payload = response.encode() if is_text else json.dumps(response).encode()
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _tick(self) -> int:
+        self.clock += 1
+        return self.clock
+
+    def _upload(self, content_type: str, body: bytes) -> Dict[str, Any]:
+        header = f"Content-Type: {content_type}\r\n\r\n".encode()
+        fields = {
+            part.get_param("name", header="content-disposition"): part
+            for part in BytesParser().parsebytes(header + body).get_payload()
+        }
+        file_id = f"file-{len(self.files)}"
+        self.uploads[file_id] = fields["file"].get_payload(decode=True).decode()
+        self.files[file_id] = {
+            "id": file_id,
+            "object": "file",
+            "bytes": len(self.uploads[file_id]),
+            "created_at": self._tick(),
+            "filename": fields["file"].get_filename(),
+            "purpose": fields["purpose"].get_payload(),
+            "status": "processed"
+        }
+        return self.files[file_id]
+
+    def _create_batch(self, input_file_id: str) -> str:
+        batch_id = f"batch-{len(self.batch_records)}"
+        self.batch_records[batch_id] = {
+            "input_file_id": input_file_id,
+            "created_at": self._tick(),
+            "polls": 0
+        }
+        return batch_id
+
+    def _list_batches(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        batch_ids = list(reversed(self.batch_records))
+        if "after" in query:
+            batch_ids = batch_ids[batch_ids.index(query["after"][0]) + 1:]
+        limit = min(int(query.get("limit", ["20"])[0]), self.page_size)
+        return {
+            "object": "list",
+            "data": [self._batch(batch_id) for batch_id in batch_ids[:limit]],
+            "has_more": len(batch_ids) > limit
+        }
+
+    def _batch(self, batch_id: str) -> Dict[str, Any]:
+        record = self.batch_records[batch_id]
+        batch = {
+            "id": batch_id,
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": record["input_file_id"],
+            "completion_window": "24h",
+            "status": "in_progress",
+            "created_at": record["created_at"],
+            "output_file_id": None,
+            "error_file_id": None
+        }
+        if record["polls"] >= self.polls_until_complete and record["input_file_id"] in self.uploads:
+            batch["status"] = "completed"
+            batch["output_file_id"] = f"{batch_id}-output"
+            batch["error_file_id"] = f"{batch_id}-errors"
+            if batch["output_file_id"] not in self.outputs:
+                output, errors = self._answer(record["input_file_id"])
+                self.outputs[batch["output_file_id"]] = output
+                self.outputs[batch["error_file_id"]] = errors
+        return batch
+
+    def _answer(self, input_file_id: str) -> Tuple[str, str]:
+        lines, errors = [], []
+        for line in self.uploads[input_file_id].splitlines():
+            request = json.loads(line)
+            body = request["body"]
+            user_content = body['messages'][-1]['content']
+            if any(text in user_content for text in self.failing_contents):
+                errors.append(json.dumps({
+                    "custom_id": request["custom_id"],
+                    "response": {
+                        "status_code": 400,
+                        "body": {"error": {"message": "Invalid request"}}
+                    },
+                    "error": None
+                }))
+                continue
+            content = f"{body['model']}: {user_content.splitlines()[-1]}"
+            lines.append(json.dumps({
+                "custom_id": request["custom_id"],
+                "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": content}}]}
+                }
+            }))
+        if self.corrupt_output and len(lines) > 1:
+            record = json.loads(lines[-1])
+            record["response"]["body"]["choices"][0]["message"]["content"] = None
+            lines[-1] = json.dumps(record)
+        if self.corrupt_output:
+            lines[0] = "{not json"
+        return "\n".join(lines), "\n".join(errors)
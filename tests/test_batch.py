@@ -0,0 +1,208 @@
+"""
+Tests for Batch API summarization through the OpenAI client and a local stand-in server.
+"""
+
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+import os
+import time
+
+import pytest
+
+from newsroom.batch import BatchSummarizer
+from newsroom.editions import STATUS_GENERATED, EditionRunner
+from newsroom.generator import NewsDigestGenerator
+from newsroom.sources.base import NewsSource
+from newsroom.sources.google_news import GoogleNewsScraper
+
+from fake_openai import FakeOpenAIServer, ProcessKilled
+
+DATE = datetime(2025, 6, 7)
+
+class FakeSource(NewsSource):
+    """News source returning fixed stories and counting fetches."""
+
+    fetches = 0
+
+    def __init__(self, max_stories: int = 10):
+        self.max_stories = max_stories
+
+    def get_stories(self) -> List[Dict[str, str]]:
+        FakeSource.fetches += 1
+        return [
+            {"title": "First", "source": "A", "url": "https://a", "summary": "first text"},
+            {"title": "Second", "source": "B", "url": "https://b", "summary": "second text"},
+            {"title": "Third", "source": "C", "url": "https://c", "summary": None}
+        ]
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeOpenAIServer]:
+    """Run a stand-in server for the duration of a test.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+
+    Yields:
+        The running server
+    """
+    fake_server = FakeOpenAIServer()
+    fake_server.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    FakeSource.fetches = 0
+    yield fake_server
+    fake_server.stop()
+
+def make_generator(tmp_path: Path, server: FakeOpenAIServer) -> NewsDigestGenerator:
+    """Create a batch mode generator talking to the stand-in server.
+
+    Args:
+        tmp_path: pytest temporary directory
+        server: Running stand-in server
+
+    Returns:
+        Generator using "small" for articles and "large" for the overview
+    """
+    return NewsDigestGenerator(
+        source_class=FakeSource,
+        output_dir=str(tmp_path / "content"),
+        article_model="small",
+        daily_model="large",
+        batch_dir=str(tmp_path / "batch"),
+        batch_poll_interval=0,
+        llm_base_url=server.url
+    )
+
+def read_digest(tmp_path: Path) -> str:
+    """Read the digest written for DATE.
+
+    Args:
+        tmp_path: pytest temporary directory
+
+    Returns:
+        Markdown content
+    """
+    with open(tmp_path / "content" / "2025-06-07.md") as f:
+        return f.read()
+
+def kill_on_sleep(seconds: float) -> None:
+    """Stand-in for time.sleep that dies while waiting for a batch.
+
+    Args:
+        seconds: Requested sleep duration
+
+    Raises:
+        ProcessKilled: Always
+    """
+    raise ProcessKilled()
+
+def test_resume_after_interrupt_does_not_resubmit_or_refetch(server, tmp_path, monkeypatch):
+    server.polls_until_complete = 2
+    with monkeypatch.context() as patch:
+        patch.setattr("newsroom.batch.time", SimpleNamespace(time=time.time, sleep=kill_on_sleep))
+        with pytest.raises(ProcessKilled):
+            make_generator(tmp_path, server).generate_digest(date=DATE)
+    assert len(server.batch_records) == 1
+
+    generator = make_generator(tmp_path, server)
+    assert generator.generate_digest(date=DATE)
+
+    assert FakeSource.fetches == 1
+    article_requests, daily_requests = server.created_requests
+    assert len(article_requests) == 2
+    assert len(daily_requests) == 1
+
+    markdown = read_digest(tmp_path)
+    assert "small: first text" in markdown
+    assert "small: second text" in markdown
+    assert "large: - No summary available." in markdown
+    assert os.listdir(tmp_path / "batch") == []
+
+    report = generator.summarizer.report.format_lines()
+    assert sum(line.startswith("article: batch (small) ok") for line in report) == 2
+    assert sum(line.startswith("daily: batch (large) ok") for line in report) == 1
+
+def test_crash_after_batch_create_adopts_existing_batch(server, tmp_path, monkeypatch):
+    generator = make_generator(tmp_path, server)
+    create = generator.summarizer.client.batches.create
+
+    def create_then_die(**kwargs: Any) -> Any:
+        create(**kwargs)
+        raise ProcessKilled()
+
+    monkeypatch.setattr(generator.summarizer.client.batches, "create", create_then_die)
+    with pytest.raises(ProcessKilled):
+        generator.generate_digest(date=DATE)
+    # Batches created by other jobs push ours off the first page of the listing
+    for _ in range(3):
+        server.add_batch()
+
+    assert make_generator(tmp_path, server).generate_digest(date=DATE)
+    assert len(server.created_requests) == 2
+    assert len(server.uploads) == 2
+    # Ours is on the second page of two-batch pages
+    assert server.requests.count(("GET", "/v1/batches")) == 2
+
+def test_find_batch_stops_at_batches_older_than_the_upload(server, tmp_path):
+    for _ in range(5):
+        server.add_batch()
+    uploaded_at = server.clock + 1
+    server.add_batch()
+    batch = BatchSummarizer(make_generator(tmp_path, server).summarizer)
+
+    assert batch._find_batch({"input_file_id": "file-0", "uploaded_at": uploaded_at}) is None
+    assert server.requests.count(("GET", "/v1/batches")) == 1
+
+def test_unreadable_output_records_count_as_failed_requests(server, tmp_path):
+    server.corrupt_output = True
+    generator = make_generator(tmp_path, server)
+    assert generator.generate_digest(date=DATE)
+
+    markdown = read_digest(tmp_path)
+    assert "small: first text" not in markdown
+    assert "small: second text" not in markdown
+    assert "_(Summarization disabled in this run)_" in markdown
+    assert "article: batch (small) error" in generator.summarizer.report.format_lines()[0]
+
+def test_error_file_requests_are_logged_by_custom_id(server, tmp_path, caplog):
+    server.failing_contents = ["second text"]
+    assert make_generator(tmp_path, server).generate_digest(date=DATE)
+
+    error = "{'message': 'Invalid request'}"
+    assert f"Batch request 2025-06-07/article-1 failed: {error}" in caplog.text
+    markdown = read_digest(tmp_path)
+    assert "small: first text" in markdown
+    assert "small: second text" not in markdown
+
+def test_leftover_state_is_cleared_once_the_digest_exists(server, tmp_path):
+    generator = make_generator(tmp_path, server)
+    generator.batch.store.save(generator.get_file_path(DATE), {"stories": {}, "calls": []})
+    os.makedirs(generator.output_dir)
+    open(generator.get_file_path(DATE), 'w').close()
+
+    assert not generator.generate_digest(date=DATE)
+    assert os.listdir(tmp_path / "batch") == []
+
+def test_editions_share_one_batch_per_phase(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(GoogleNewsScraper, "get_stories", lambda self: FakeSource().get_stories())
+    editions = [{"name": "us", "gl": "US"}, {"name": "uk", "gl": "GB"}]
+    runner = EditionRunner(
+        editions,
+        output_root=str(tmp_path / "content"),
+        batch_dir=str(tmp_path / "batch"),
+        batch_poll_interval=0,
+        article_model="small",
+        daily_model="large",
+        base_url=server.url
+    )
+
+    assert runner.run(date=DATE) == {"us": STATUS_GENERATED, "uk": STATUS_GENERATED}
+
+    article_requests, daily_requests = server.created_requests
+    # Identical articles across editions are requested once
+    assert len(article_requests) == 2
+    assert sorted(request["custom_id"] for request in daily_requests) == ["uk/daily", "us/daily"]
+    for name in ("us", "uk"):
+        with open(tmp_path / "content" / name / "2025-06-07.md") as f:
+            assert "small: second text" in f.read()
@@ -0,0 +1,65 @@
+"""
+Tests for editions config loading and multi-edition runs.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+import json
+
+import pytest
+
+from newsroom.editions import STATUS_FAILED, STATUS_GENERATED, EditionRunner, load_editions
+from newsroom.sources.google_news import GoogleNewsScraper
+
+def write_config(tmp_path, editions: Any) -> str:
+    """Write an editions config file.
+
+    Args:
+        tmp_path: pytest temporary directory
+        editions: Value of the "editions" key
+
+    Returns:
+        Path to the config file
+    """
+    path = tmp_path / "editions.json"
+    path.write_text(json.dumps({"editions": editions}))
+    return str(path)
+
+def test_load_editions_accepts_valid_config(tmp_path):
+    editions = [
+        {"name": "uk-business", "hl": "en-GB", "gl": "GB", "ceid": "GB:en", "topic": "BUSINESS"}
+    ]
+
+    assert load_editions(write_config(tmp_path, editions)) == editions
+
+@pytest.mark.parametrize("editions", [
+    ["us"],
+    [{"name": 3}],
+    [{"name": "Not A Slug"}],
+    [{"name": "digests"}],
+    [{"name": "us"}, {"name": "us"}],
+    [{"name": "us", "region": "US"}],
+    [{"name": "us", "topic": 3}]
+])
+def test_load_editions_rejects_invalid_editions(tmp_path, editions):
+    with pytest.raises(ValueError):
+        load_editions(write_config(tmp_path, editions))
+
+def test_run_reports_failed_edition_by_name(tmp_path, monkeypatch, caplog):
+    def get_stories(self: GoogleNewsScraper) -> List[Dict[str, str]]:
+        if self.params.get("gl") == "XX":
+            return []
+        return [{"title": "Story", "source": "A", "url": "https://a", "summary": "text"}]
+
+    monkeypatch.setattr(GoogleNewsScraper, "get_stories", get_stories)
+    runner = EditionRunner(
+        [{"name": "us", "gl": "US"}, {"name": "broken", "gl": "XX"}],
+        output_root=str(tmp_path),
+        use_llm=False
+    )
+
+    statuses = runner.run(date=datetime(2025, 6, 7))
+
+    assert statuses == {"us": STATUS_GENERATED, "broken": STATUS_FAILED}
+    assert "No stories fetched for edition broken" in caplog.text
+    assert (tmp_path / "us" / "2025-06-07.md").exists()
@@ -0,0 +1,130 @@
+"""
+Tests for model tiering and fallback in LLMSummarizer.
+"""
+
+from typing import Dict, List, Optional
+
+import pytest
+from openai import APIStatusError, APITimeoutError
+
+from newsroom.summarizer import LLMSummarizer
+
+class FakeTimeout(APITimeoutError):
+    """APITimeoutError that needs no HTTP request object."""
+
+    def __init__(self):
+        Exception.__init__(self, "Request timed out.")
+
+class FakeStatusError(APIStatusError):
+    """APIStatusError with a status code but no HTTP response object."""
+
+    def __init__(self, status_code: int):
+        Exception.__init__(self, f"Error code: {status_code}")
+        self.status_code = status_code
+
+def make_summarizer(
+    monkeypatch: pytest.MonkeyPatch,
+    failures: Dict[str, List[Optional[Exception]]]
+) -> LLMSummarizer:
+    """Create a summarizer whose requests fail per model as scripted.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+        failures: Exceptions to raise by model, consumed one per call; None or
+            an exhausted list means the call succeeds
+
+    Returns:
+        Summarizer using "small" for articles and "large" for the overview
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    summarizer = LLMSummarizer(
+        article_model="small",
+        daily_model="large",
+        article_latency_budget=5,
+        daily_latency_budget=30
+    )
+
+    def request_completion(
+        model: str,
+        prompt: str,
+        content: str,
+        max_tokens: int,
+        timeout: Optional[float]
+    ) -> str:
+        scripted = failures.get(model, [])
+        error = scripted.pop(0) if scripted else None
+        if error:
+            raise error
+        return f"{model} (timeout={timeout})"
+
+    monkeypatch.setattr(summarizer, "_request_completion", request_completion)
+    return summarizer
+
+def report_prefixes(summarizer: LLMSummarizer) -> List[str]:
+    """Strip the latency from each report line.
+
+    Args:
+        summarizer: Summarizer with recorded calls
+
+    Returns:
+        Lines like "article: primary (small) ok"
+    """
+    return [line.rsplit(" in ", 1)[0] for line in summarizer.report.format_lines()]
+
+def test_stage_budgets_apply_to_primary_tier_only(monkeypatch):
+    summarizer = make_summarizer(monkeypatch, {})
+
+    assert summarizer.summarize_article("text") == "small (timeout=5)"
+    assert summarizer.summarize_day(["summary"]) == "large (timeout=30)"
+
+def test_timeout_switches_stage_to_fallback_until_reset(monkeypatch):
+    summarizer = make_summarizer(monkeypatch, {"small": [FakeTimeout()]})
+
+    assert summarizer.summarize_article("first") == "large (timeout=None)"
+    assert summarizer.tiers.get_tiers(LLMSummarizer.STAGE_ARTICLE) == [
+        ("fallback", "large"), ("primary", "small")
+    ]
+    assert summarizer.summarize_article("second") == "large (timeout=None)"
+    assert report_prefixes(summarizer) == [
+        "article: primary (small) timeout",
+        "article: fallback (large) ok",
+        "article: fallback (large) ok"
+    ]
+    assert summarizer.tiers.get_tiers(LLMSummarizer.STAGE_DAILY) == [
+        ("primary", "large"), ("fallback", "small")
+    ]
+
+    summarizer.reset_run()
+    assert summarizer.report.calls == []
+    assert summarizer.summarize_article("third") == "small (timeout=5)"
+
+@pytest.mark.parametrize("status_code", [429, 503])
+def test_unavailable_status_switches_stage(monkeypatch, status_code):
+    summarizer = make_summarizer(monkeypatch, {"small": [FakeStatusError(status_code)]})
+
+    summarizer.summarize_article("first")
+    assert LLMSummarizer.STAGE_ARTICLE in summarizer.tiers.degraded_stages
+
+@pytest.mark.parametrize("error", [FakeStatusError(400), AttributeError("content is None")])
+def test_request_specific_error_falls_back_for_that_call_only(monkeypatch, error):
+    summarizer = make_summarizer(monkeypatch, {"small": [error]})
+
+    assert summarizer.summarize_article("first") == "large (timeout=None)"
+    assert summarizer.summarize_article("second") == "small (timeout=5)"
+    assert report_prefixes(summarizer) == [
+        "article: primary (small) error",
+        "article: fallback (large) ok",
+        "article: primary (small) ok"
+    ]
+
+def test_every_tier_failing_returns_none(monkeypatch):
+    summarizer = make_summarizer(
+        monkeypatch,
+        {"small": [FakeStatusError(500)], "large": [FakeStatusError(500)]}
+    )
+
+    assert summarizer.summarize_article("text") is None
+    assert report_prefixes(summarizer) == [
+        "article: primary (small) error",
+        "article: fallback (large) error"
+    ]